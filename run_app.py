@@ -7,6 +7,7 @@
 
 import sys
 import os
+import logging
 
 def print_banner():
     """
@@ -43,10 +44,7 @@ def start_gui():
     """
     try:
         import tkinter as tk
-        # 确保能正确导入src模块
-        import sys
-        import os
-        # 将当前目录添加到Python路径
+        # 确保能正确导入src模块，将当前目录添加到Python路径
         sys.path.append(os.path.dirname(os.path.abspath(__file__)))
         from src.gui import main as gui_main
         print("正在启动图形界面...")
@@ -64,6 +62,12 @@ def main():
     """
     主入口函数
     """
+    # 日志只在入口处配置一次，使用 --debug 参数可查看详细的调试信息
+    logging.basicConfig(
+        level=logging.DEBUG if "--debug" in sys.argv else logging.WARNING,
+        format="%(asctime)s %(name)s %(levelname)s: %(message)s"
+    )
+    
     # 打印横幅
     print_banner()
     
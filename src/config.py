@@ -5,37 +5,61 @@
 提供样式自定义选项
 """
 
+import os
+from types import MappingProxyType
+
+# 项目自带的手写字体文件（位于项目根目录），按优先顺序排列
+BUNDLED_FONT_FILES = ("LingWaiTC-Medium.otf", "Hanzipen.ttc")
+
+# 已找到的自带字体路径，首次调用get_available_fonts()时确定
+_available_fonts = None
+
+# 页面分辨率（每英寸像素数）
+PAGE_DPI = 300
+
+# 页面尺寸（像素，宽 x 高），按PAGE_DPI换算，导入时计算一次
+PAGE_SIZES = MappingProxyType({
+    "A5横版": (int(210 * PAGE_DPI / 25.4), int(148 * PAGE_DPI / 25.4)),  # 约2480x1748像素
+})
+
+# 手写体配置的默认值（只读），HandwritingConfig的初始化和to_dict()共用
+DEFAULT_CONFIG = MappingProxyType({
+    # 页面设置（A5横版，300dpi）
+    "page_width": PAGE_SIZES["A5横版"][0],
+    "page_height": PAGE_SIZES["A5横版"][1],
+    
+    # 字体设置
+    "font_path": None,  # 自定义字体路径
+    "font_size": 120,  # 字体大小（增大字号）
+    "fill": 0,  # 文字颜色（0为黑色）
+    
+    # 排版设置
+    "left_margin": 100,  # 左边距
+    "top_margin": 120,  # 上边距（适当增加）
+    "right_margin": 100,  # 右边距
+    "bottom_margin": 120,  # 下边距（适当增加）
+    
+    # 间距设置
+    "line_spacing": 140,  # 行间距（根据字体大小调整）
+    "word_spacing": 20,  # 字间距（适当增加）
+    "letter_spacing": 0,  # 字母间距
+    
+    # 随机扰动设置（控制手写自然度）
+    "line_spacing_sigma": 8,  # 行间距随机扰动（适当增加）
+    "word_spacing_sigma": 3,  # 字间距随机扰动（适当增加）
+    "letter_spacing_sigma": 0.5,  # 字母间距随机扰动
+    "font_size_sigma": 3,  # 字体大小随机扰动（适当增加）
+})
+
 class HandwritingConfig:
     """
     手写体配置类
     用于存储和管理手写体生成的各种参数
     """
     def __init__(self):
-        # 页面设置（A5横版，300dpi）
-        self.page_width = int(210 * 300 / 25.4)  # 约2480像素
-        self.page_height = int(148 * 300 / 25.4)  # 约1748像素
-        
-        # 字体设置
-        self.font_path = None  # 自定义字体路径
-        self.font_size = 120  # 字体大小（增大字号）
-        self.fill = 0  # 文字颜色（0为黑色）
-        
-        # 排版设置
-        self.left_margin = 100  # 左边距
-        self.top_margin = 120  # 上边距（适当增加）
-        self.right_margin = 100  # 右边距
-        self.bottom_margin = 120  # 下边距（适当增加）
-        
-        # 间距设置
-        self.line_spacing = 140  # 行间距（根据字体大小调整）
-        self.word_spacing = 20  # 字间距（适当增加）
-        self.letter_spacing = 0  # 字母间距
-        
-        # 随机扰动设置（控制手写自然度）
-        self.line_spacing_sigma = 8  # 行间距随机扰动（适当增加）
-        self.word_spacing_sigma = 3  # 字间距随机扰动（适当增加）
-        self.letter_spacing_sigma = 0.5  # 字母间距随机扰动
-        self.font_size_sigma = 3  # 字体大小随机扰动（适当增加）
+        # 所有参数从DEFAULT_CONFIG初始化
+        for key, value in DEFAULT_CONFIG.items():
+            setattr(self, key, value)
     
     def update_from_dict(self, config_dict):
         """
@@ -55,24 +79,34 @@ class HandwritingConfig:
         Returns:
             dict: 配置参数字典
         """
-        return {
-            "page_width": self.page_width,
-            "page_height": self.page_height,
-            "font_path": self.font_path,
-            "font_size": self.font_size,
-            "fill": self.fill,
-            "left_margin": self.left_margin,
-            "top_margin": self.top_margin,
-            "right_margin": self.right_margin,
-            "bottom_margin": self.bottom_margin,
-            "line_spacing": self.line_spacing,
-            "word_spacing": self.word_spacing,
-            "letter_spacing": self.letter_spacing,
-            "line_spacing_sigma": self.line_spacing_sigma,
-            "word_spacing_sigma": self.word_spacing_sigma,
-            "letter_spacing_sigma": self.letter_spacing_sigma,
-            "font_size_sigma": self.font_size_sigma
-        }
+        return {key: getattr(self, key) for key in DEFAULT_CONFIG}
+
+# 预设样式表：样式名称 -> 相对默认配置需要修改的参数
+PRESET_STYLES = {
+    # 默认样式
+    "default": {},
+    # 紧凑样式
+    "compact": {
+        "font_size": 36,
+        "line_spacing": 60,
+        "word_spacing": 5,
+        "left_margin": 80,
+        "right_margin": 80,
+    },
+    # 整洁样式
+    "neat": {
+        "font_size_sigma": 1,
+        "line_spacing_sigma": 3,
+        "word_spacing_sigma": 1,
+    },
+    # 随意样式
+    "casual": {
+        "font_size_sigma": 3,
+        "line_spacing_sigma": 10,
+        "word_spacing_sigma": 3,
+        "letter_spacing_sigma": 1,
+    },
+}
 
 def get_preset_styles():
     """
@@ -81,29 +115,23 @@ def get_preset_styles():
     Returns:
         dict: 预设样式字典
     """
-    presets = {
-        "default": HandwritingConfig(),  # 默认样式
-        "compact": HandwritingConfig(),  # 紧凑样式
-        "neat": HandwritingConfig(),     # 整洁样式
-        "casual": HandwritingConfig()    # 随意样式
-    }
-    
-    # 配置紧凑样式
-    presets["compact"].font_size = 36
-    presets["compact"].line_spacing = 60
-    presets["compact"].word_spacing = 5
-    presets["compact"].left_margin = 80
-    presets["compact"].right_margin = 80
-    
-    # 配置整洁样式
-    presets["neat"].font_size_sigma = 1
-    presets["neat"].line_spacing_sigma = 3
-    presets["neat"].word_spacing_sigma = 1
-    
-    # 配置随意样式
-    presets["casual"].font_size_sigma = 3
-    presets["casual"].line_spacing_sigma = 10
-    presets["casual"].word_spacing_sigma = 3
-    presets["casual"].letter_spacing_sigma = 1
-    
+    presets = {}
+    for name, overrides in PRESET_STYLES.items():
+        presets[name] = HandwritingConfig()
+        presets[name].update_from_dict(overrides)
     return presets
+
+def get_available_fonts():
+    """
+    获取项目自带且实际存在的字体文件路径
+    结果在首次调用时确定并缓存，之后不再重复检查文件系统
+    
+    Returns:
+        list: 字体文件路径列表，按BUNDLED_FONT_FILES的顺序排列
+    """
+    global _available_fonts
+    if _available_fonts is None:
+        project_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        font_paths = [os.path.join(project_dir, name) for name in BUNDLED_FONT_FILES]
+        _available_fonts = [path for path in font_paths if os.path.exists(path)]
+    return _available_fonts
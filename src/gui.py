@@ -9,28 +9,94 @@ import tkinter as tk
 from tkinter import ttk, scrolledtext, filedialog, messagebox
 import os
 import threading
-import asyncio
+import queue
 import socket  # 移到外部导入
+import subprocess
+import datetime
+from functools import partial
 from PIL import Image, ImageTk
 # 尝试相对导入，如果失败则使用绝对导入
 try:
     from .main import convert_text_to_handwriting
     from .config import get_preset_styles
-    from .ollama_utils import (
-        get_ollama_models, stream_chat_with_ollama,
-        DEFAULT_SYSTEM_PROMPT, TEXT_ENHANCEMENT_PROMPT
-    )
+    from .ollama_utils import get_ollama_models, stream_chat_with_ollama
 except ImportError:
     import sys
-    import os
     # 将父目录添加到Python路径
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
     from src.main import convert_text_to_handwriting
     from src.config import get_preset_styles
-    from src.ollama_utils import (
-        get_ollama_models, stream_chat_with_ollama,
-        DEFAULT_SYSTEM_PROMPT, TEXT_ENHANCEMENT_PROMPT
-    )
+    from src.ollama_utils import get_ollama_models, stream_chat_with_ollama
+
+# AI流式输出的刷新间隔（毫秒），该间隔内收到的内容合并后一次性写入文本框
+STREAM_FLUSH_INTERVAL_MS = 40
+
+# 停止拖动窗口多久后（毫秒）用高质量算法重新缩放预览图
+PREVIEW_SMOOTH_DELAY_MS = 150
+
+# 预览图大幅缩小时先按整数倍快速缩小，剩余缩放比例不小于该值时再用LANCZOS，
+# 画质与直接LANCZOS缩放几乎相同
+PREVIEW_REDUCING_GAP = 2.0
+
+# 后台任务线程池常驻的线程数（模型刷新、服务测试、AI生成可同时进行）
+MAX_BACKGROUND_WORKERS = 4
+
+class BackgroundWorkers:
+    """
+    后台任务线程池
+    线程执行完任务后继续等待下一个任务，不必每次点击都新建线程；
+    所有线程都在忙时（如已停止的生成仍在等待模型返回）临时新建线程，任务不会排队等待，
+    临时线程执行完任务后退出，常驻线程数保持在max_workers以内；
+    工作线程为守护线程，关闭窗口时不会因为未完成的请求而阻塞退出
+    """
+    def __init__(self, max_workers=MAX_BACKGROUND_WORKERS):
+        """
+        初始化线程池
+        
+        Args:
+            max_workers: 常驻线程数
+        """
+        self.max_workers = max_workers
+        self.tasks = queue.Queue()
+        self.threads = []
+        # 空闲线程计数，提交任务时优先交给空闲线程
+        self.idle = threading.Semaphore(0)
+        self.lock = threading.Lock()
+    
+    def submit(self, func, *args):
+        """
+        提交后台任务
+        
+        Args:
+            func: 要在后台线程中执行的函数
+            *args: 传给函数的参数
+        """
+        self.tasks.put((func, args))
+        if self.idle.acquire(blocking=False):
+            return
+        # 没有空闲线程时新建线程，避免新任务等待被占用的线程
+        with self.lock:
+            thread = threading.Thread(target=self.worker_loop, daemon=True)
+            self.threads.append(thread)
+            thread.start()
+    
+    def worker_loop(self):
+        """
+        工作线程主循环，依次执行队列中的任务
+        """
+        while True:
+            func, args = self.tasks.get()
+            try:
+                func(*args)
+            except Exception as e:
+                print(f"后台任务出错: {e}")
+            
+            # 线程数超过常驻数量时，多出的线程执行完任务后退出
+            with self.lock:
+                if len(self.threads) > self.max_workers:
+                    self.threads.remove(threading.current_thread())
+                    return
+            self.idle.release()
 
 class HandwritingApp:
     """
@@ -50,8 +116,29 @@ class HandwritingApp:
         
         # Ollama相关属性
         self.selected_model = tk.StringVar(value="")
+        self.model_names = []
         self.ai_response = ""
         self.stream_running = False
+        # 当前AI生成请求的停止标志，每次发送请求时新建
+        self.stop_event = threading.Event()
+        
+        # 等待写入AI输出框的流式内容
+        self.pending_output = []
+        self.pending_output_lock = threading.Lock()
+        self.output_flush_scheduled = False
+        
+        # 后台任务线程池
+        self.workers = BackgroundWorkers()
+        
+        # Ollama服务测试对话框（首次使用时创建）
+        self.test_window = None
+        # 服务测试的编号，每次测试加1，旧测试的结果不再写入对话框
+        self.test_run_id = 0
+        
+        # 预览原图，窗口大小改变时从内存中重新缩放，不再重新读取文件
+        self.preview_source = None
+        self.preview_size = None
+        self.preview_smooth_job = None
         
         # 创建标签页控件
         self.notebook = ttk.Notebook(root)
@@ -68,8 +155,9 @@ class HandwritingApp:
         # 设置主页面UI
         self.setup_main_ui()
         
-        # 设置AI页面UI
-        self.setup_ai_ui()
+        # AI页面UI在首次切换到该页面时再创建，避免启动时就连接Ollama服务
+        self.ai_ui_initialized = False
+        self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
         # 底部状态栏
         self.status_var = tk.StringVar(value="就绪")
@@ -119,6 +207,15 @@ class HandwritingApp:
         # 预览标签
         self.preview_label = ttk.Label(self.preview_frame, text="转换后的手写体图片将在这里显示")
         self.preview_label.pack(expand=True)
+        self.preview_frame.bind("<Configure>", self.on_preview_resized)
+    
+    def on_tab_changed(self, event=None):
+        """
+        标签页切换时的处理，首次进入AI页面时创建其UI组件
+        """
+        if not self.ai_ui_initialized and self.notebook.select() == str(self.ai_frame):
+            self.ai_ui_initialized = True
+            self.setup_ai_ui()
     
     def setup_ai_ui(self):
         """
@@ -136,14 +233,15 @@ class HandwritingApp:
         ttk.Label(model_frame, text="选择Ollama模型：").pack(side=tk.LEFT, padx=(0, 5))
         
         # 刷新模型按钮
-        ttk.Button(model_frame, text="刷新模型列表", command=self.refresh_ollama_models).pack(side=tk.RIGHT, padx=(10, 0))
+        self.refresh_button = ttk.Button(model_frame, text="刷新模型列表", command=self.refresh_ollama_models)
+        self.refresh_button.pack(side=tk.RIGHT, padx=(10, 0))
         
         # 模型下拉框
         self.model_combo = ttk.Combobox(model_frame, textvariable=self.selected_model, state="readonly", width=30)
         self.model_combo.pack(side=tk.LEFT, padx=(0, 10))
         
-        # 刷新模型列表
-        self.refresh_ollama_models()
+        # 刷新模型列表：待页面其余组件创建并绘制完成后再开始
+        self.root.after_idle(self.refresh_ollama_models)
         
         # 提示词输入区域
         prompt_frame = ttk.Frame(ai_frame)
@@ -158,9 +256,14 @@ class HandwritingApp:
         preset_frame = ttk.Frame(prompt_frame)
         preset_frame.pack(fill=tk.X, pady=(5, 0))
         
-        ttk.Button(preset_frame, text="生成文本", command=lambda: self.prompt_input.insert(tk.END, "请帮我生成一段关于...的内容，适合手写练习。")).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(preset_frame, text="优化文本", command=lambda: self.prompt_input.insert(tk.END, "请帮我优化以下文本使其更适合手写：")).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(preset_frame, text="调整格式", command=lambda: self.prompt_input.insert(tk.END, "请帮我调整以下文本的格式，使其更易读：")).pack(side=tk.LEFT)
+        preset_prompts = [
+            ("生成文本", "请帮我生成一段关于...的内容，适合手写练习。"),
+            ("优化文本", "请帮我优化以下文本使其更适合手写："),
+            ("调整格式", "请帮我调整以下文本的格式，使其更易读："),
+        ]
+        for button_text, preset_prompt in preset_prompts:
+            ttk.Button(preset_frame, text=button_text,
+                       command=partial(self.prompt_input.insert, tk.END, preset_prompt)).pack(side=tk.LEFT, padx=(0, 10))
         
         # 控制按钮
         control_frame = ttk.Frame(ai_frame)
@@ -219,28 +322,50 @@ class HandwritingApp:
     def refresh_ollama_models(self):
         """
         刷新Ollama可用模型列表
+        在后台线程中获取模型，避免界面在连接Ollama服务期间失去响应
         """
-        try:
-            if not hasattr(self, 'status_var'):
-                self.status_var = tk.StringVar(value="正在获取Ollama模型列表...")
-            else:
-                self.status_var.set("正在获取Ollama模型列表...")
-                
-            # 设置超时时间，避免长时间等待
-            socket.setdefaulttimeout(10)  # 设置10秒超时
+        if not hasattr(self, 'status_var'):
+            self.status_var = tk.StringVar(value="正在获取Ollama模型列表...")
+        else:
+            self.status_var.set("正在获取Ollama模型列表...")
+        
+        # 获取完成前禁用刷新按钮，避免重复请求
+        self.refresh_button.config(state=tk.DISABLED)
+        
+        # 设置超时时间，避免长时间等待
+        socket.setdefaulttimeout(10)  # 设置10秒超时
+        
+        def run_refresh():
+            try:
+                # get_ollama_models() 现在直接返回模型名称列表
+                model_names = get_ollama_models()
+                error = None
+            except Exception as e:
+                model_names = []
+                error = e
             
-            # 显示进度信息
-            self.show_info_dialog("提示", "正在连接Ollama服务获取可用模型...\n请稍候片刻...")
+            # 在主线程中更新UI
+            self.root.after(0, self.on_models_refreshed, model_names, error)
+        
+        self.workers.submit(run_refresh)
+    
+    def on_models_refreshed(self, model_names, error=None):
+        """
+        在主线程中处理模型列表的获取结果
+        
+        Args:
+            model_names: 模型名称列表
+            error: 获取过程中出现的异常，成功时为None
+        """
+        self.refresh_button.config(state=tk.NORMAL)
+        
+        try:
+            if error is not None:
+                raise error
             
-            # get_ollama_models() 现在直接返回模型名称列表
-            model_names = get_ollama_models()
+            self.update_model_choices(model_names)
             
             if model_names:
-                self.model_combo['values'] = model_names
-                if model_names:
-                    # 默认选择第一个模型
-                    self.selected_model.set(model_names[0])
-                
                 # 格式化模型列表，方便用户查看
                 models_text = "\n".join([f"- {model}" for model in model_names])
                 self.status_var.set(f"已加载 {len(model_names)} 个模型")
@@ -249,8 +374,6 @@ class HandwritingApp:
                     f"已成功加载 {len(model_names)} 个Ollama模型\n\n{models_text}\n\n现在您可以开始使用AI功能了！"
                 )
             else:
-                self.model_combo['values'] = []
-                self.selected_model.set("")
                 self.status_var.set("未找到可用的Ollama模型")
                 
                 # 详细的错误提示和故障排除步骤
@@ -301,29 +424,73 @@ class HandwritingApp:
                 "请尝试重启Ollama服务和应用程序"
             )
             
+    def update_model_choices(self, model_names):
+        """
+        更新模型下拉框，仅在模型列表变化时重设选项
+        
+        Args:
+            model_names: 模型名称列表
+        """
+        if model_names != self.model_names:
+            self.model_combo['values'] = model_names
+            self.model_names = model_names
+        
+        # 保留用户当前选择的模型，仅在其不可用时默认选择第一个模型
+        if self.selected_model.get() not in model_names:
+            self.selected_model.set(model_names[0] if model_names else "")
+    
+    def create_test_window(self):
+        """
+        创建Ollama服务测试对话框
+        """
+        test_window = tk.Toplevel(self.root)
+        test_window.title("Ollama服务测试")
+        test_window.geometry("400x300")
+        test_window.resizable(False, False)
+        
+        # 居中显示
+        test_window.transient(self.root)
+        # 关闭时仅隐藏窗口，便于下次复用
+        test_window.protocol("WM_DELETE_WINDOW", self.close_test_window)
+        
+        # 添加测试结果文本框
+        self.test_result_text = tk.Text(test_window, wrap=tk.WORD, width=45, height=12)
+        self.test_result_text.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
+        
+        # 添加关闭按钮
+        close_button = tk.Button(test_window, text="关闭", command=self.close_test_window, 
+                               width=15, height=1, font=('SimHei', 10))
+        close_button.pack(pady=10)
+        
+        self.test_window = test_window
+    
+    def close_test_window(self):
+        """
+        隐藏Ollama服务测试对话框
+        """
+        self.test_window.grab_release()
+        self.test_window.withdraw()
+    
     def test_ollama_service(self):
         """
         测试Ollama服务是否正在运行并可访问
         """
         try:
-            # 创建一个简单的测试对话框
-            test_window = tk.Toplevel(self.root)
-            test_window.title("Ollama服务测试")
-            test_window.geometry("400x300")
-            test_window.resizable(False, False)
-            
-            # 居中显示
-            test_window.transient(self.root)
-            test_window.grab_set()
+            # 测试对话框只创建一次，之后重新打开时复用
+            if self.test_window is None or not self.test_window.winfo_exists():
+                self.create_test_window()
+            else:
+                self.test_window.deiconify()
+            self.test_window.grab_set()
             
-            # 添加测试结果文本框
-            result_text = tk.Text(test_window, wrap=tk.WORD, width=45, height=12)
-            result_text.pack(padx=20, pady=10, fill=tk.BOTH, expand=True)
+            # 标记本次测试，之前仍在进行的测试结束后不再更新对话框
+            self.test_run_id += 1
+            run_id = self.test_run_id
             
-            # 添加关闭按钮
-            close_button = tk.Button(test_window, text="关闭", command=test_window.destroy, 
-                                   width=15, height=1, font=('SimHei', 10))
-            close_button.pack(pady=10)
+            # 清空上次的测试结果
+            result_text = self.test_result_text
+            result_text.config(state=tk.NORMAL)
+            result_text.delete(1.0, tk.END)
             
             # 测试服务连接
             result_text.insert(tk.END, "正在测试Ollama服务连接...\n")
@@ -352,7 +519,6 @@ class HandwritingApp:
                         test_result += f"! 模型列表API错误: {models_response.status_code}\n"
                     
                     # 检查进程
-                    import subprocess
                     result = subprocess.run(['ps', 'aux'], capture_output=True, text=True)
                     ollama_processes = [line for line in result.stdout.split('\n') if 'ollama' in line]
                     test_result += f"\n找到 {len(ollama_processes)} 个Ollama相关进程\n"
@@ -366,17 +532,16 @@ class HandwritingApp:
                 
                 # 在主线程中更新UI
                 def update_ui():
+                    if run_id != self.test_run_id:
+                        return
                     result_text.insert(tk.END, test_result)
                     result_text.insert(tk.END, "\n提示：如果测试失败，请重启Ollama应用并下载模型")
                     result_text.config(state=tk.DISABLED)  # 设置为只读
                 
                 self.root.after(0, update_ui)
             
-            # 启动测试线程
-            import threading
-            test_thread = threading.Thread(target=run_test)
-            test_thread.daemon = True
-            test_thread.start()
+            # 在后台线程中执行测试
+            self.workers.submit(run_test)
             
         except Exception as e:
             self.show_error_dialog("测试失败", f"执行Ollama服务测试时出错: {e}")
@@ -402,7 +567,14 @@ class HandwritingApp:
             return
         
         try:
+            # 结束仍在进行的上一次生成，避免旧的输出混入本次结果
+            self.stop_event.set()
+            stop_event = threading.Event()
+            self.stop_event = stop_event
+            
             # 清空之前的输出
+            with self.pending_output_lock:
+                self.pending_output.clear()
             self.ai_output.delete(1.0, tk.END)
             self.ai_response = ""
             
@@ -413,9 +585,6 @@ class HandwritingApp:
             self.send_button.config(state=tk.DISABLED)
             self.stop_button.config(state=tk.NORMAL)
             
-            # 创建停止标志
-            self.stop_generation = False
-            
             # 在单独线程中运行流式响应
             def run_stream():
                 try:
@@ -439,47 +608,40 @@ class HandwritingApp:
                     # 从system_prompt字典中提取content作为系统提示词
                     system_prompt_text = system_prompt['content']
                     for content in stream_chat_with_ollama(model, prompt, system_prompt_text):
-                        if self.stop_generation:
+                        if stop_event.is_set():
                             break
                         success = True
-                            
-                        # 在主线程中更新UI
-                        def update_ui(content=content):
-                            self.ai_output.insert(tk.END, content)
-                            self.ai_output.see(tk.END)
-                            self.ai_response += content
-                            
-                        self.root.after(0, update_ui)
+                        self.queue_ai_output(content, stop_event)
+                    
+                    # 立即写入剩余的内容
+                    self.root.after(0, self.flush_ai_output)
                     
                     # 完成后的操作
-                    if not success and not self.stop_generation:
-                        self.root.after(0, lambda: self.status_var.set("未收到AI响应"))
-                        self.root.after(0, lambda: self.show_error_dialog("无响应", "未收到AI模型的响应，请检查模型是否正常工作"))
-                    elif not self.stop_generation:
-                        self.root.after(0, lambda: self.status_var.set("AI生成完成"))
+                    if not success and not stop_event.is_set():
+                        self.root.after(0, self.status_var.set, "未收到AI响应")
+                        self.root.after(0, self.show_error_dialog, "无响应", "未收到AI模型的响应，请检查模型是否正常工作")
+                    elif not stop_event.is_set():
+                        self.root.after(0, self.status_var.set, "AI生成完成")
                         # 移除对不存在的import_button的引用
                 except socket.timeout:
-                    self.root.after(0, lambda: self.status_var.set("AI请求超时"))
-                    self.root.after(0, lambda: self.show_error_dialog("请求超时", "AI模型响应超时，请尝试更简单的提示或检查模型状态"))
+                    self.root.after(0, self.status_var.set, "AI请求超时")
+                    self.root.after(0, self.show_error_dialog, "请求超时", "AI模型响应超时，请尝试更简单的提示或检查模型状态")
                 except ConnectionRefusedError:
-                    self.root.after(0, lambda: self.status_var.set("连接失败"))
-                    self.root.after(0, lambda: self.show_error_dialog("连接失败", "无法连接到Ollama服务，请确保服务正在运行"))
+                    self.root.after(0, self.status_var.set, "连接失败")
+                    self.root.after(0, self.show_error_dialog, "连接失败", "无法连接到Ollama服务，请确保服务正在运行")
                 except KeyError as e:
-                    self.root.after(0, lambda: self.status_var.set("响应格式错误"))
-                    self.root.after(0, lambda: self.show_error_dialog("格式错误", f"AI响应格式错误: {str(e)}"))
+                    self.root.after(0, self.status_var.set, "响应格式错误")
+                    self.root.after(0, self.show_error_dialog, "格式错误", f"AI响应格式错误: {str(e)}")
                 except Exception as e:
                     error_msg = f"AI请求处理失败: {str(e)}"
-                    self.root.after(0, lambda: self.status_var.set(f"AI请求失败"))
-                    self.root.after(0, lambda msg=error_msg: self.show_error_dialog("错误", msg))
+                    self.root.after(0, self.status_var.set, "AI请求失败")
+                    self.root.after(0, self.show_error_dialog, "错误", error_msg)
                 finally:
                     # 恢复按钮状态
-                    self.root.after(0, lambda: self.send_button.config(state=tk.NORMAL))
-                    self.root.after(0, lambda: self.stop_button.config(state=tk.DISABLED))
+                    self.root.after(0, self.finish_ai_request, stop_event)
             
-            # 启动线程
-            thread = threading.Thread(target=run_stream)
-            thread.daemon = True
-            thread.start()
+            # 在后台线程中执行生成
+            self.workers.submit(run_stream)
             
         except Exception as e:
             self.status_var.set(f"启动请求失败")
@@ -487,11 +649,58 @@ class HandwritingApp:
             self.send_button.config(state=tk.NORMAL)
             self.stop_button.config(state=tk.DISABLED)
     
+    def queue_ai_output(self, content, stop_event):
+        """
+        缓存流式内容，并按固定间隔在主线程中批量写入输出框
+        可在后台线程中调用
+        
+        Args:
+            content: 新收到的内容片段
+            stop_event: 内容所属请求的停止标志，请求已停止或已被新请求取代时丢弃内容
+        """
+        with self.pending_output_lock:
+            # 发送新请求时先设置旧请求的停止标志，再在锁内清空待写入内容，
+            # 因此在锁内检查即可保证旧请求的内容不会混入新请求的输出
+            if stop_event.is_set() or stop_event is not self.stop_event:
+                return
+            self.pending_output.append(content)
+            if self.output_flush_scheduled:
+                return
+            self.output_flush_scheduled = True
+        
+        self.root.after(STREAM_FLUSH_INTERVAL_MS, self.flush_ai_output)
+    
+    def flush_ai_output(self):
+        """
+        将缓存的流式内容一次性写入AI输出框
+        """
+        with self.pending_output_lock:
+            content = "".join(self.pending_output)
+            self.pending_output.clear()
+            self.output_flush_scheduled = False
+        
+        if content:
+            self.ai_output.insert(tk.END, content)
+            self.ai_output.see(tk.END)
+            self.ai_response += content
+    
+    def finish_ai_request(self, stop_event):
+        """
+        AI请求结束后恢复按钮状态
+        已被新请求取代的旧请求不再修改按钮，以免影响正在进行的生成
+        
+        Args:
+            stop_event: 结束的请求对应的停止标志
+        """
+        if stop_event is self.stop_event:
+            self.send_button.config(state=tk.NORMAL)
+            self.stop_button.config(state=tk.DISABLED)
+    
     def stop_ai_generation(self):
         """
         停止AI生成
         """
-        self.stop_generation = True
+        self.stop_event.set()
         self.status_var.set("已停止AI生成")
         self.send_button.config(state=tk.NORMAL)
         self.stop_button.config(state=tk.DISABLED)
@@ -500,6 +709,8 @@ class HandwritingApp:
         """
         清空AI输出
         """
+        with self.pending_output_lock:
+            self.pending_output.clear()
         self.ai_output.delete(1.0, tk.END)
         self.ai_response = ""
         self.status_var.set("已清空AI输出")
@@ -511,13 +722,7 @@ class HandwritingApp:
         if self.ai_response:
             # 切换到主页面
             self.notebook.select(0)
-            # 清空主页面输入
-            self.text_input.delete(1.0, tk.END)
-            # 导入AI生成的内容
-            self.text_input.insert(tk.END, self.ai_response)
-            self.status_var.set("已从AI页面导入内容")
-        else:
-            self.status_var.set("没有可导入的AI生成内容")
+        self.import_from_ai()
     
     def import_from_ai(self):
         """
@@ -558,7 +763,6 @@ class HandwritingApp:
             output_dir = os.path.join(os.path.dirname(os.path.dirname(__file__)), "output")
             os.makedirs(output_dir, exist_ok=True)
             
-            import datetime
             timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = os.path.join(output_dir, f"handwritten_gui_{timestamp}.png")
         except Exception as e:
@@ -577,12 +781,19 @@ class HandwritingApp:
                 self.status_var.set("文本过长")
                 return
             
-            success = convert_text_to_handwriting(text, output_path, font_path, style=style)
+            page_paths = convert_text_to_handwriting(text, output_path, font_path, style=style)
             
-            if success:
-                self.status_var.set(f"转换成功！文件已保存")
-                self.show_info_dialog("成功", f"转换成功！\n文件已保存到: {output_path}")
-                self.show_preview(output_path)
+            if page_paths:
+                # 文字超出一页时会生成多张图片，对话框只列出目录和首末文件名，预览显示第一页
+                self.status_var.set(f"转换成功！共{len(page_paths)}页，文件已保存")
+                saved_files = os.path.basename(page_paths[0])
+                if len(page_paths) > 1:
+                    saved_files += f" ~ {os.path.basename(page_paths[-1])}"
+                self.show_info_dialog(
+                    "成功",
+                    f"转换成功！共{len(page_paths)}页\n文件已保存到: {os.path.dirname(page_paths[0])}\n文件: {saved_files}"
+                )
+                self.show_preview(page_paths[0])
             else:
                 self.show_error_dialog("错误", "转换失败，请检查错误信息")
                 self.status_var.set("转换失败")
@@ -604,37 +815,83 @@ class HandwritingApp:
             image_path: 图片路径
         """
         try:
-            # 加载图片
-            image = Image.open(image_path)
+            # 加载图片，只读取一次并保存在内存中
+            with Image.open(image_path) as image:
+                image.load()
+                # 二值图片缩放时PIL会忽略LANCZOS而使用最近邻采样，细笔画容易丢失，
+                # 因此载入时转换一次灰度，之后每次缩放和显示都不再转换模式
+                if image.mode == "1":
+                    image = image.convert("L")
+                self.preview_source = image
             
-            # 调整图片大小以适应预览区域
-            max_width = self.preview_frame.winfo_width() - 20
-            max_height = self.preview_frame.winfo_height() - 20
-            
-            # 如果预览区域还没有大小信息，使用默认值
-            if max_width < 100:  # 假设100是最小合理宽度
-                max_width = 700
-            if max_height < 100:
-                max_height = 400
-            
-            # 计算调整后的尺寸，保持宽高比
-            width, height = image.size
-            ratio = min(max_width / width, max_height / height)
-            new_width = int(width * ratio)
-            new_height = int(height * ratio)
-            
-            # 调整图片大小
-            resized_image = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # 转换为tkinter可用的格式
-            tk_image = ImageTk.PhotoImage(resized_image)
-            
-            # 更新预览
-            self.preview_label.config(image=tk_image, text="")
-            self.preview_label.image = tk_image  # 保持引用，防止被垃圾回收
+            self.preview_size = (self.preview_frame.winfo_width(), self.preview_frame.winfo_height())
+            self.render_preview()
             
         except Exception as e:
             messagebox.showerror("错误", f"显示预览失败: {str(e)}")
+    
+    def on_preview_resized(self, event):
+        """
+        预览区域大小改变时，按新尺寸重新缩放已加载的预览图
+        """
+        # 拖动窗口时会连续触发多次事件，尺寸未变化时不重复缩放
+        size = (event.width, event.height)
+        if self.preview_source is not None and size != self.preview_size:
+            self.preview_size = size
+            # 拖动过程中使用快速缩放，停止拖动后再用高质量算法缩放一次
+            self.render_preview(Image.Resampling.NEAREST)
+            if self.preview_smooth_job is not None:
+                self.root.after_cancel(self.preview_smooth_job)
+            self.preview_smooth_job = self.root.after(PREVIEW_SMOOTH_DELAY_MS, self.finish_preview_resize)
+    
+    def finish_preview_resize(self):
+        """
+        窗口停止缩放后，用高质量算法重新绘制预览图
+        """
+        self.preview_smooth_job = None
+        if self.preview_source is not None:
+            self.render_preview()
+    
+    def render_preview(self, resample=Image.Resampling.LANCZOS):
+        """
+        将内存中的预览原图缩放到预览区域大小并显示
+        
+        Args:
+            resample: 缩放算法，默认使用高质量的LANCZOS
+        """
+        image = self.preview_source
+        
+        # 调整图片大小以适应预览区域
+        max_width = self.preview_frame.winfo_width() - 20
+        max_height = self.preview_frame.winfo_height() - 20
+        
+        # 如果预览区域还没有大小信息，使用默认值
+        if max_width < 100:  # 假设100是最小合理宽度
+            max_width = 700
+        if max_height < 100:
+            max_height = 400
+        
+        # 计算调整后的尺寸，保持宽高比
+        width, height = image.size
+        ratio = min(max_width / width, max_height / height)
+        new_width = int(width * ratio)
+        new_height = int(height * ratio)
+        
+        # 调整图片大小
+        resized_image = image.resize((new_width, new_height), resample, reducing_gap=PREVIEW_REDUCING_GAP)
+        
+        # 尺寸相同时直接把像素写入已有的图片对象，不再创建新的Tk图片
+        tk_image = getattr(self.preview_label, "image", None)
+        if tk_image is not None and (tk_image.width(), tk_image.height()) == resized_image.size:
+            tk_image.paste(resized_image)
+            return
+        
+        # 转换为tkinter可用的格式
+        tk_image = ImageTk.PhotoImage(resized_image)
+        
+        # 更新预览
+        self.preview_label.config(image=tk_image, text="")
+        self.preview_label.image = tk_image  # 保持引用，防止被垃圾回收
 
 def main():
     """
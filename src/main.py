@@ -7,18 +7,223 @@
 
 from handright import Template, handwrite
 from PIL import Image, ImageFont
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import os
 # 尝试相对导入，如果失败则使用绝对导入
 try:
-    from .config import HandwritingConfig, get_preset_styles
+    from .config import HandwritingConfig, get_preset_styles, get_available_fonts
 except ImportError:
     import sys
-    import os
     # 将父目录添加到Python路径
     sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-    from src.config import HandwritingConfig, get_preset_styles
+    from src.config import HandwritingConfig, get_preset_styles, get_available_fonts
 
-def convert_text_to_handwriting(text, output_path, font_path=None, style=None, custom_config=None):
+# 一个字体（含全部字号变体）最多缓存的字形位图数量，所有字号共用这一上限，
+# 单个位图约10KB，上限约占20MB内存
+GLYPH_CACHE_SIZE = 2048
+
+# 一个字体最多缓存的字号变体数量
+FONT_VARIANT_CACHE_SIZE = 64
+
+def lru_get(cache, key):
+    """
+    从LRU缓存读取，命中时标记为最近使用
+    
+    Args:
+        cache (OrderedDict): 缓存
+        key: 缓存键
+    
+    Returns:
+        缓存的值，未命中时为None
+    """
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+def lru_put(cache, key, value, max_size):
+    """
+    写入LRU缓存，超过上限时移除最久未使用的记录
+    
+    Args:
+        cache (OrderedDict): 缓存
+        key: 缓存键
+        value: 缓存的值
+        max_size (int): 缓存上限
+    """
+    cache[key] = value
+    if len(cache) > max_size:
+        cache.popitem(last=False)
+
+class CachedFreeTypeFont(ImageFont.FreeTypeFont):
+    """
+    带字号变体缓存的FreeType字体
+    handright为模拟字号扰动，会对每个字符调用font_variant()，
+    默认实现每次都重新读取字体文件并创建新的FreeType字体对象，
+    这里按字号缓存变体，相同字号只加载一次；
+    同时缓存每个字符的字形位图和边界框，重复出现的字符不再重新栅格化。
+    基础字体和它的所有字号变体共用同一组缓存，缓存键包含字号，总量受GLYPH_CACHE_SIZE限制
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._variants = OrderedDict()
+        self._masks = OrderedDict()
+        self._bboxes = OrderedDict()
+
+    def font_variant(self, font=None, size=None, index=None, encoding=None, layout_engine=None):
+        """
+        获取指定字号的字体变体，仅字号不同时使用缓存
+
+        Args:
+            size (int, optional): 字体大小，其余参数与PIL的font_variant相同
+
+        Returns:
+            FreeTypeFont: 字体对象
+        """
+        if font is not None or index is not None or encoding is not None or layout_engine is not None:
+            return super().font_variant(font, size, index, encoding, layout_engine)
+
+        size = self.size if size is None else size
+        variant = lru_get(self._variants, size)
+        if variant is None:
+            variant = CachedFreeTypeFont(self.path, size, self.index, self.encoding, self.layout_engine)
+            # 变体与基础字体共用缓存
+            variant._variants = self._variants
+            variant._masks = self._masks
+            variant._bboxes = self._bboxes
+            lru_put(self._variants, size, variant, FONT_VARIANT_CACHE_SIZE)
+        return variant
+
+    def release_variants(self):
+        """
+        释放缓存的字号变体
+        每个变体都持有一份FreeType字体数据，长文本转换后会占用大量内存，
+        转换结束后释放，下次转换时按需重新创建（每个约0.5毫秒）；字形缓存有总量上限，继续保留
+        """
+        self._variants.clear()
+
+    def getmask2(self, text, mode="", *args, **kwargs):
+        """
+        获取文字位图，相同字号和参数的结果从缓存读取
+
+        Returns:
+            tuple: (位图, 偏移量)，与PIL的getmask2相同
+        """
+        try:
+            key = (self.size, text, mode, args, tuple(
+                (name, tuple(value) if isinstance(value, list) else value)
+                for name, value in sorted(kwargs.items())
+            ))
+            cached = lru_get(self._masks, key)
+        except TypeError:
+            # 参数不可哈希时不使用缓存
+            return super().getmask2(text, mode, *args, **kwargs)
+
+        if cached is None:
+            cached = super().getmask2(text, mode, *args, **kwargs)
+            lru_put(self._masks, key, cached, GLYPH_CACHE_SIZE)
+        return cached
+
+    def getbbox(self, text, *args, **kwargs):
+        """
+        获取文字边界框，仅按字号和文字缓存默认参数下的结果
+
+        Returns:
+            tuple: (left, top, right, bottom)
+        """
+        if args or kwargs:
+            return super().getbbox(text, *args, **kwargs)
+
+        key = (self.size, text)
+        bbox = lru_get(self._bboxes, key)
+        if bbox is None:
+            bbox = super().getbbox(text)
+            lru_put(self._bboxes, key, bbox, GLYPH_CACHE_SIZE)
+        return bbox
+
+def load_default_font(font_size):
+    """
+    加载PIL的默认字体
+    
+    Args:
+        font_size (int): 字体大小，Pillow 10.1以下版本的默认字体不支持指定字号
+    
+    Returns:
+        ImageFont: 默认字体
+    """
+    try:
+        return ImageFont.load_default(size=font_size)
+    except TypeError:
+        return ImageFont.load_default()
+
+@lru_cache(maxsize=2)
+def load_font(font_path, font_size):
+    """
+    加载字体，相同字体和字号只加载一次
+    缓存的字体对象在多次转换间保留其已栅格化的字形位图（每个字体最多GLYPH_CACHE_SIZE个，约20MB），
+    因此最多只缓存两个字体；字号变体在每次转换结束后释放
+    
+    Args:
+        font_path (str): 字体文件路径，为空或不存在时使用默认字体
+        font_size (int): 字体大小
+    
+    Returns:
+        FreeTypeFont: 字体对象，调用方不应修改
+    """
+    if font_path and os.path.exists(font_path):
+        try:
+            return CachedFreeTypeFont(font_path, size=font_size)
+        except Exception as e:
+            print(f"警告：无法加载指定字体，使用默认字体: {e}")
+    
+    # 使用PIL的默认字体
+    return load_default_font(font_size)
+
+@lru_cache(maxsize=4)
+def get_blank_background(size):
+    """
+    获取指定尺寸的白色背景
+    handright渲染每页时会复制背景而不会修改它，因此同尺寸的背景可在多次转换间复用
+
+    Args:
+        size (tuple): 背景尺寸 (宽, 高)
+
+    Returns:
+        Image: 白色二值背景图片，调用方不应修改
+    """
+    return Image.new(mode="1", size=size, color=1)
+
+def get_page_path(output_path, page_number):
+    """
+    获取指定页的保存路径
+    第一页直接使用输出路径，之后的页在文件名后加页码，如 output_2.png
+    
+    Args:
+        output_path (str): 输出图片路径
+        page_number (int): 页码，从1开始
+    
+    Returns:
+        str: 该页的保存路径
+    """
+    if page_number == 1:
+        return output_path
+    root, ext = os.path.splitext(output_path)
+    return f"{root}_{page_number}{ext}"
+
+def save_page(image, page_path):
+    """
+    保存一页手写体图片
+    
+    Args:
+        image (Image): 页面图片
+        page_path (str): 保存路径
+    """
+    image.save(page_path)
+    print(f"手写体图片已保存到: {page_path}")
+
+def convert_text_to_handwriting(text, output_path, font_path=None, style=None, custom_config=None, seed=None):
     """
     将文字转换为手写体图片
     
@@ -28,10 +233,15 @@ def convert_text_to_handwriting(text, output_path, font_path=None, style=None, c
         font_path (str, optional): 字体文件路径
         style (str, optional): 预设样式名称 (default, compact, neat, casual)
         custom_config (dict, optional): 自定义配置参数
+        seed (hashable, optional): 随机种子，相同种子和参数生成相同的图片
+    
+    Returns:
+        list: 按页码顺序排列的已保存图片路径，第一页为output_path；转换失败时为空列表
     """
-    # 获取配置
-    if style and style in get_preset_styles():
-        config = get_preset_styles()[style]
+    # 获取配置（预设样式只构建一次）
+    presets = get_preset_styles()
+    if style and style in presets:
+        config = presets[style]
     else:
         config = HandwritingConfig()
     
@@ -43,21 +253,18 @@ def convert_text_to_handwriting(text, output_path, font_path=None, style=None, c
     if font_path and os.path.exists(font_path):
         config.font_path = font_path
     
-    # 创建字体
-    if config.font_path and os.path.exists(config.font_path):
-        try:
-            font = ImageFont.truetype(config.font_path, size=config.font_size)
-        except Exception as e:
-            print(f"警告：无法加载指定字体，使用默认字体: {e}")
-            # 尝试使用PIL的默认字体
-            font = ImageFont.load_default()
-    else:
-        # 使用PIL的默认字体
-        font = ImageFont.load_default()
+    # 未指定有效字体时，使用项目自带的手写字体
+    if not (config.font_path and os.path.exists(config.font_path)):
+        available_fonts = get_available_fonts()
+        if available_fonts:
+            config.font_path = available_fonts[0]
+    
+    # 创建字体（相同字体和字号复用已加载的字体对象）
+    font = load_font(config.font_path, config.font_size)
     
     # 创建模板，使用handright库支持的基本参数
     template = Template(
-        background=Image.new(mode="1", size=(config.page_width, config.page_height), color=1),  # 白色背景
+        background=get_blank_background((config.page_width, config.page_height)),  # 白色背景
         font=font,  # 使用指定字体或默认字体
         line_spacing=config.line_spacing,
         word_spacing=config.word_spacing,
@@ -72,19 +279,32 @@ def convert_text_to_handwriting(text, output_path, font_path=None, style=None, c
     
     # 生成手写体
     try:
-        # handwrite返回的是一个生成器，需要转换为列表
-        images = list(handwrite(text, template))
-        # 保存第一张图片（通常只有一张）
-        if images:
-            images[0].save(output_path)
-            print(f"手写体图片已保存到: {output_path}")
-            return True
-        else:
+        # handwrite返回的是惰性迭代器，每取一页才渲染一页
+        # 逐页渲染并交给写入线程保存，渲染下一页的同时编码写入上一页，
+        # 上一页写完才提交下一页，内存中最多同时保留两页，文字超出一页时也不会被截断
+        page_paths = []
+        pending_save = None
+        with ThreadPoolExecutor(max_workers=1) as writer:
+            for page_number, image in enumerate(handwrite(text, template, seed=seed), start=1):
+                if pending_save is not None:
+                    pending_save.result()
+                page_path = get_page_path(output_path, page_number)
+                pending_save = writer.submit(save_page, image, page_path)
+                page_paths.append(page_path)
+            
+            if pending_save is not None:
+                pending_save.result()
+        
+        if not page_paths:
             print("生成手写体图片失败")
-            return False
+        return page_paths
     except Exception as e:
         print(f"转换过程中出错: {e}")
-        return False
+        return []
+    finally:
+        # 字体对象会被缓存复用，转换结束后释放字号变体占用的内存
+        if isinstance(font, CachedFreeTypeFont):
+            font.release_variants()
 
 if __name__ == "__main__":
     # 示例文本
@@ -95,8 +315,10 @@ if __name__ == "__main__":
     os.makedirs(output_dir, exist_ok=True)
     
     # 检查是否有字体文件
-    font_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), "LingWaiTC-Medium.otf")
-    if not os.path.exists(font_path):
+    available_fonts = get_available_fonts()
+    if available_fonts:
+        font_path = available_fonts[0]
+    else:
         font_path = None
         print("未找到字体文件，使用默认字体")
     
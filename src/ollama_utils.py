@@ -5,13 +5,11 @@ Ollama API 调用工具模块
 提供与本地Ollama服务交互的功能
 """
 
-import asyncio
+import logging
 from typing import List, Dict, Any, Generator, AsyncGenerator
-from ollama import chat as ollama_chat
-from ollama import generate as ollama_generate
-from ollama import list as ollama_list
 from ollama import Client, AsyncClient
-from ollama import ChatResponse
+
+logger = logging.getLogger(__name__)
 
 class OllamaAPI:
     """
@@ -19,12 +17,13 @@ class OllamaAPI:
     提供同步和异步的API调用方法
     """
     
-    def __init__(self, host: str = "http://localhost:11434"):
+    def __init__(self, host: str = None):
         """
         初始化Ollama API客户端
         
         Args:
-            host: Ollama服务地址
+            host: Ollama服务地址，为None时与ollama库默认客户端相同，
+                  读取OLLAMA_HOST环境变量，未设置时使用http://localhost:11434
         """
         self.host = host
         self.client = Client(host=host)
@@ -38,8 +37,8 @@ class OllamaAPI:
             模型列表，每个模型包含name等信息
         """
         try:
-            print("正在调用ollama_list()获取模型列表...")
-            result = ollama_list()
+            print("正在调用client.list()获取模型列表...")
+            result = self.client.list()
             
             # 详细记录API响应
             print(f"Ollama API响应类型: {type(result)}")
@@ -62,15 +61,6 @@ class OllamaAPI:
                     print("警告: 未找到预期格式的模型列表")
                     # 打印完整响应以便调试
                     print(f"完整响应内容: {result}")
-                    # 尝试直接使用客户端获取模型
-                    print("尝试使用客户端的list方法...")
-                    try:
-                        client_result = self.client.list()
-                        print(f"客户端list方法响应: {client_result}")
-                        if isinstance(client_result, dict) and 'models' in client_result:
-                            found_models = client_result['models']
-                    except Exception as e:
-                        print(f"客户端list方法失败: {e}")
                 
                 # 验证并过滤模型
                 valid_models = []
@@ -97,8 +87,7 @@ class OllamaAPI:
                 
         except Exception as e:
             print(f"获取模型列表失败: {type(e).__name__}: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.debug("获取模型列表失败", exc_info=e)
             return []
     
     def chat_completion(self, model: str, messages: List[Dict[str, str]], 
@@ -119,7 +108,7 @@ class OllamaAPI:
             if system_prompt:
                 messages = [{"role": "system", "content": system_prompt}] + messages
             
-            response = ollama_chat(model=model, messages=messages)
+            response = self.client.chat(model=model, messages=messages)
             return response['message']['content']
         except Exception as e:
             print(f"聊天完成失败: {e}")
@@ -143,7 +132,7 @@ class OllamaAPI:
             if system_prompt:
                 messages = [{"role": "system", "content": system_prompt}] + messages
             
-            stream = ollama_chat(
+            stream = self.client.chat(
                 model=model,
                 messages=messages,
                 stream=True
@@ -224,10 +213,10 @@ def get_ollama_models() -> List[str]:
         print("调用get_ollama_models()...")
         model_names = []
         
-        # 直接使用ollama.list()获取模型
+        # 使用全局OllamaAPI实例的客户端获取模型
         try:
-            direct_result = ollama_list()
-            print(f"直接调用ollama.list()结果: {direct_result}")
+            direct_result = ollama_api.client.list()
+            print(f"调用client.list()结果: {direct_result}")
             print(f"直接调用返回类型: {type(direct_result)}")
             
             # 检查是否为Ollama特定的ListResponse类型
@@ -273,32 +262,16 @@ def get_ollama_models() -> List[str]:
                                 print(f"未知的模型对象类型: {type(model)}, 值: {model}")
                         break
             else:
-                print(f"ollama.list()返回的结果格式不符合预期: {direct_result}")
+                print(f"client.list()返回的结果格式不符合预期: {direct_result}")
             
             if model_names:
                 print(f"成功提取到模型名称: {model_names}")
                 return model_names
             else:
-                print("警告: 无法从ollama.list()结果中提取模型名称")
-                
-                # 备用方案：尝试直接导入ollama并使用
-                try:
-                    print("尝试直接导入ollama库...")
-                    import ollama
-                    direct_ollama_result = ollama.list()
-                    print(f"直接使用ollama库结果: {direct_ollama_result}")
-                    
-                    if hasattr(direct_ollama_result, 'models'):
-                        for model in direct_ollama_result.models:
-                            if hasattr(model, 'model'):
-                                model_names.append(model.model)
-                                print(f"添加模型名称: {model.model}")
-                except Exception as direct_error:
-                    print(f"直接导入ollama库失败: {direct_error}")
+                print("警告: 无法从client.list()结果中提取模型名称")
         except Exception as e:
-            print(f"直接调用ollama.list()失败: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"调用client.list()失败: {e}")
+            logger.debug("调用client.list()失败", exc_info=e)
         
         print(f"最终获取到 {len(model_names)} 个模型名称")
         if model_names:
@@ -307,8 +280,7 @@ def get_ollama_models() -> List[str]:
         return model_names
     except Exception as e:
         print(f"获取Ollama模型名称列表失败: {type(e).__name__}: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.debug("获取Ollama模型名称列表失败", exc_info=e)
         return []
 
 def chat_with_ollama(model: str, prompt: str, system_prompt: str = None) -> str: